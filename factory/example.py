@@ -79,20 +79,28 @@ class WAVAudioExporter(AudioExporter):
     print(f"Exporting audio data in WAV format to {folder}.")
 
 
+# the exporters are stateless, so a single shared instance of each is enough
+_H264BP = H264BPVideoExporter()
+_H264HI = H264Hi422PVideoExporter()
+_LOSSLESS = LosslessVideoExporter()
+_AAC = AACAudioExporter()
+_WAV = WAVAudioExporter()
+
+
 class ExporterFactory(ABC):
   """
   Factory that represents a combination of video and audio codecs.
-  The factory doesn't maintain any of the instances it creates.
+  The factory hands out shared instances of the (stateless) exporters.
   """
 
   @abstractmethod
   def get_video_exporter(self) -> VideoExporter:
-    """Returns a new video exporter instance."""
+    """Returns a video exporter instance."""
     pass
 
   @abstractmethod
   def get_audio_exporter(self) -> AudioExporter:
-    """Returns a new audio exporter instance."""
+    """Returns an audio exporter instance."""
     pass
 
 
@@ -100,30 +108,30 @@ class FastExporter(ExporterFactory):
   """Factory aimed at providing a high speed, lower quality export."""
 
   def get_video_exporter(self) -> VideoExporter:
-    return H264BPVideoExporter()
+    return _H264BP
 
   def get_audio_exporter(self) -> AudioExporter:
-    return AACAudioExporter()
+    return _AAC
 
 
 class HighQualityExporter(ExporterFactory):
   """Factory aimed at providing a slower speed, high quality export."""
 
   def get_video_exporter(self) -> VideoExporter:
-    return H264Hi422PVideoExporter()
+    return _H264HI
 
   def get_audio_exporter(self) -> AudioExporter:
-    return AACAudioExporter()
+    return _AAC
 
 
 class MasterQualityExporter(ExporterFactory):
   """Factory aimed at providing a high speed, high quality export."""
 
   def get_video_exporter(self) -> VideoExporter:
-    return LosslessVideoExporter()
+    return _LOSSLESS
 
   def get_audio_exporter(self) -> AudioExporter:
-    return WAVAudioExporter()
+    return _WAV
 
 
 FACTORIES = {
@@ -132,6 +140,8 @@ FACTORIES = {
   "master": MasterQualityExporter(),
 }
 
+_PROMPT = f"Enter desired output quality ({', '.join(FACTORIES)}): "
+
 # Helper function
 def read_factory() -> ExporterFactory:
   """
@@ -140,12 +150,11 @@ def read_factory() -> ExporterFactory:
   """
   # read the desired export quality
   while True:
-    export_quality = input(
-        f"Enter desired output quality ({', '.join(FACTORIES)}): ")
-    try:
-        return FACTORIES[export_quality]
-    except KeyError:
-        print(f"Unknown output quality option: {export_quality}!")
+    export_quality = input(_PROMPT)
+    factory = FACTORIES.get(export_quality)
+    if factory is not None:
+      return factory
+    print(f"Unknown output quality option: {export_quality}!")
 
 def do_export(fac: ExporterFactory) -> None:
   """Do a test export using a video and audio exporters."""
@@ -1,9 +1,9 @@
 """
 Basic video exporting example
 """
-from typing import Protocol, Type
+from typing import Optional, Protocol, Type
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 class VideoExporter(Protocol):
@@ -75,7 +75,7 @@ class WAVAudioExporter:
   def do_export(self, folder: Path) -> None:
     print(f"Exporting audio data in WAV format to {folder}.")
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MediaExporter:
   video: VideoExporter
   audio: AudioExporter
@@ -84,9 +84,14 @@ class MediaExporter:
 class MediaExporterFactory:
   video_class: Type[VideoExporter]
   audio_class: Type[AudioExporter]
+  _cached: Optional[MediaExporter] = field(
+      default=None, init=False, repr=False, compare=False)
   
   def __call__(self) -> MediaExporter:
-    return MediaExporter(self.video_class(), self.audio_class())
+    # the exporters are stateless, so build the media exporter once and reuse it
+    if self._cached is None:
+      self._cached = MediaExporter(self.video_class(), self.audio_class())
+    return self._cached
   
 FACTORIES = {
   "low": MediaExporterFactory(H264BPVideoExporter, AACAudioExporter),
@@ -94,6 +99,8 @@ FACTORIES = {
   "master": MediaExporterFactory(LosslessVideoExporter, WAVAudioExporter),
 }
 
+_PROMPT = f"Enter desired output quality ({', '.join(FACTORIES)}): "
+
 # Helper function
 def read_factory() -> MediaExporterFactory:
   """
@@ -102,12 +109,11 @@ def read_factory() -> MediaExporterFactory:
   """
   # read the desired export quality
   while True:
-    export_quality = input(
-        f"Enter desired output quality ({', '.join(FACTORIES)}): ")
-    try:
-        return FACTORIES[export_quality]
-    except KeyError:
-        print(f"Unknown output quality option: {export_quality}!")
+    export_quality = input(_PROMPT)
+    factory = FACTORIES.get(export_quality)
+    if factory is not None:
+      return factory
+    print(f"Unknown output quality option: {export_quality}!")
 
 def do_export(exporter: MediaExporter) -> None:
   """Do a test export using a video and audio exporters."""
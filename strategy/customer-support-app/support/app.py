@@ -1,5 +1,6 @@
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 import random
 # from abc import ABC, abstractmethod
 from typing import Optional, Protocol
@@ -7,7 +8,7 @@ from typing import Optional, Protocol
 from support.ticket import SupportTicket
 
 # we can also use the Callable to define the type of TicketOrderingStrategy
-TicketOrderingStrategy = Callable[[list[SupportTicket]], list[SupportTicket]]
+TicketOrderingStrategy = Callable[[list[SupportTicket]], Iterable[SupportTicket]]
 
 # class TicketOrderingStrategy(Protocol):
 
@@ -17,23 +18,28 @@ TicketOrderingStrategy = Callable[[list[SupportTicket]], list[SupportTicket]]
 #     ...
 
 
+# FIFO and FILO don't need a copy of the tickets, iterating over them is enough
 class FIFOOrderingStrategy:
 
-  def __call__(self, tickets: list[SupportTicket]) -> list[SupportTicket]:
-    return tickets.copy()
+  def __call__(self, tickets: list[SupportTicket]) -> Iterable[SupportTicket]:
+    return iter(tickets)
 
 
 class FILOOrderingStrategy:
 
-  def __call__(self, tickets: list[SupportTicket]) -> list[SupportTicket]:
-    return list(reversed(tickets))
+  def __call__(self, tickets: list[SupportTicket]) -> Iterable[SupportTicket]:
+    return reversed(tickets)
 
 
 # a way to add extra parameters with functions is using closures
 def random_strategy_creator(seed: Optional[int] = None) -> TicketOrderingStrategy:
+  # seed a dedicated generator once, instead of the global one on every call
+  rng = random.Random(seed)
+
   def random_strategy(tickets: list[SupportTicket]) -> list[SupportTicket]:
-    random.seed(seed)
-    return random.sample(tickets, len(tickets))
+    ordered = list(tickets)
+    rng.shuffle(ordered)
+    return ordered
 
   return random_strategy
 
@@ -42,10 +48,15 @@ def random_strategy_creator(seed: Optional[int] = None) -> TicketOrderingStrateg
 @dataclass
 class RadnomOrderingStrategy:
   seed: Optional[int] = None
+  _rng: random.Random = field(init=False, repr=False, compare=False)
+
+  def __post_init__(self):
+    self._rng = random.Random(self.seed)
 
   def __call__(self, tickets: list[SupportTicket]) -> list[SupportTicket]:
-    random.seed(self.seed)
-    return random.sample(tickets, len(tickets))
+    ordered = list(tickets)
+    self._rng.shuffle(ordered)
+    return ordered
 
 
 class CustomerSupport:
@@ -57,18 +68,19 @@ class CustomerSupport:
     self.tickets.append(ticket)
 
   def process_tickets(self, processing_strategy: TicketOrderingStrategy):
-    # create the ordered list of tickets
-    ticket_list = processing_strategy(self.tickets)
+    # create the ordered tickets
+    ticket_iter = iter(processing_strategy(self.tickets))
 
     # if it's empty, don't do anything
-    if len(ticket_list) == 0:
+    first_ticket = next(ticket_iter, None)
+    if first_ticket is None:
       print("There are no tickets to process. Well done!")
       return
 
-    # go through the tickets list and process each ticket
-    for ticket in ticket_list:
-      print(f"Processing ticket {ticket.id}...")
-      ticket.process()
+    # go through the tickets and process each ticket
+    # (a zero-length deque drains the map in C without building a list)
+    first_ticket.process()
+    deque(map(SupportTicket.process, ticket_iter), maxlen=0)
 
     # clear the tickets list
     self.tickets = []
@@ -8,7 +8,7 @@ def generate_id(length: int = 8):
   return "".join(random.choices(string.ascii_uppercase, k=length))
 
 
-@dataclass
+@dataclass(slots=True)
 class SupportTicket:
   customer: str
   issue: str
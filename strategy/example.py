@@ -8,6 +8,8 @@ def generate_id(length=8):
   return ''.join(random.choices(string.ascii_uppercase + string.digits, k=length))
 
 class SupportTicket:
+  __slots__ = ("id", "customer", "issue")
+
   id: str
   customer: str
   issue: str